@@ -2,9 +2,9 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
 import logging
-from typing import Dict, cast
+from typing import cast
 
-from pants.engine.addresses import Address, Addresses
+from pants.engine.addresses import Addresses
 from pants.engine.console import Console
 from pants.engine.goal import Goal, GoalSubsystem, LineOriented
 from pants.engine.rules import Get, collect_rules, goal_rule
@@ -52,47 +52,39 @@ class List(Goal):
 async def list_targets(
     addresses: Addresses, list_subsystem: ListSubsystem, console: Console
 ) -> List:
-    if not addresses:
-        logger.warning(f"No targets were matched in goal `{list_subsystem.name}`.")
-        return List(exit_code=0)
-
-    if list_subsystem.provides and list_subsystem.documented:
+    provides_enabled = list_subsystem.provides
+    documented_enabled = list_subsystem.documented
+    if provides_enabled and documented_enabled:
         raise ValueError(
             "Cannot specify both `--list-documented` and `--list-provides` at the same time. "
             "Please choose one."
         )
 
-    if list_subsystem.provides:
-        targets = await Get(UnexpandedTargets, Addresses, addresses)
-        addresses_with_provide_artifacts = {
-            tgt.address: tgt[ProvidesField].value
-            for tgt in targets
-            if tgt.get(ProvidesField).value is not None
-        }
-        with list_subsystem.line_oriented(console) as print_stdout:
-            for address, artifact in addresses_with_provide_artifacts.items():
-                print_stdout(f"{address.spec} {artifact}")
+    if not addresses:
+        logger.warning(f"No targets were matched in goal `{list_subsystem.name}`.")
         return List(exit_code=0)
 
-    if list_subsystem.documented:
+    if not (provides_enabled or documented_enabled):
+        lines = [address.spec for address in sorted(addresses)]
+    else:
+        field_type = ProvidesField if provides_enabled else DescriptionField
         targets = await Get(UnexpandedTargets, Addresses, addresses)
-        addresses_with_descriptions = cast(
-            Dict[Address, str],
-            {
-                tgt.address: tgt[DescriptionField].value
-                for tgt in targets
-                if tgt.get(DescriptionField).value is not None
-            },
-        )
-        with list_subsystem.line_oriented(console) as print_stdout:
-            for address, description in addresses_with_descriptions.items():
-                formatted_description = "\n  ".join(description.strip().split("\n"))
-                print_stdout(f"{address.spec}\n  {formatted_description}")
-        return List(exit_code=0)
-
+        lines = []
+        for tgt in targets:
+            value = tgt.get(field_type).value
+            if value is None:
+                continue
+            if provides_enabled:
+                lines.append(f"{tgt.address.spec} {value}")
+            else:
+                formatted_description = value.strip().replace("\n", "\n  ")
+                lines.append(f"{tgt.address.spec}\n  {formatted_description}")
+
+    # NB: We emit a single write of all lines joined by the separator rather than one write per
+    # line, which is noticeably cheaper for large numbers of targets.
     with list_subsystem.line_oriented(console) as print_stdout:
-        for address in sorted(addresses):
-            print_stdout(address.spec)
+        if lines:
+            print_stdout(list_subsystem.sep.join(lines))
     return List(exit_code=0)
 
 
@@ -25,6 +25,7 @@ def run_goal(
     show_documented: bool = False,
     show_provides: bool = False,
     provides_columns: str | None = None,
+    sep: str = "\\n",
 ) -> tuple[str, str]:
     with mock_console(create_options_bootstrapper()) as (console, stdio_reader):
         run_rule_with_mocks(
@@ -33,7 +34,7 @@ def run_goal(
                 Addresses(tgt.address for tgt in targets),
                 create_goal_subsystem(
                     ListSubsystem,
-                    sep="\\n",
+                    sep=sep,
                     output_file=None,
                     documented=show_documented,
                     provides=show_provides,
@@ -64,6 +65,14 @@ def test_list_normal() -> None:
     )
 
 
+def test_list_custom_sep() -> None:
+    target_names = ("t2", "t1")
+    stdout, _ = run_goal(
+        [MockTarget({}, Address("", target_name=name)) for name in target_names], sep=","
+    )
+    assert stdout == "//:t1,//:t2,"
+
+
 def test_no_targets_warns() -> None:
     _, stderr = run_goal([])
     assert re.search("WARN.* No targets", stderr)
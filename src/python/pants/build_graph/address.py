@@ -244,6 +244,8 @@ class Address(EngineAwareParameter):
             self._target_name = None
 
         self._hash = hash((self.spec_path, self._relative_file_path, self._target_name))
+        # Lazily computed by `spec`, which is requested repeatedly (e.g. by `__str__`).
+        self._spec: Optional[str] = None
         if PurePath(spec_path).name.startswith("BUILD"):
             raise InvalidSpecPath(
                 f"The address {self.spec} has {PurePath(spec_path).name} as the last part of its "
@@ -284,6 +286,11 @@ class Address(EngineAwareParameter):
 
         :API: public
         """
+        if self._spec is None:
+            self._spec = self._compute_spec()
+        return self._spec
+
+    def _compute_spec(self) -> str:
         prefix = "//" if not self.spec_path else ""
         file_portion = f"{prefix}{self.spec_path}"
         if self._relative_file_path is not None:
@@ -137,6 +137,13 @@ class LineOriented(Outputting):
             help="String to use to separate lines in line-oriented output.",
         )
 
+    @final
+    @property
+    def sep(self) -> str:
+        """The unescaped separator that `line_oriented` appends to each printed line."""
+        sep = self.options.sep  # type: ignore[attr-defined]
+        return cast(str, sep.encode().decode("unicode_escape"))
+
     @final
     @contextmanager
     def line_oriented(self, console: "Console") -> Iterator[Callable[[str], None]]:
@@ -144,6 +151,6 @@ class LineOriented(Outputting):
 
         The passed options instance will generally be the `Goal.Options` of an `Outputting` `Goal`.
         """
-        sep = self.options.sep.encode().decode("unicode_escape")  # type: ignore[attr-defined]
+        sep = self.sep
         with self.output_sink(console) as output_sink:
             yield lambda msg: print(msg, file=output_sink, end=sep)
@@ -232,23 +232,34 @@ def _detect_cycles(
         # If we did not break out early, it's because there were no file addresses in the cycle.
         raise CycleException(address, (*path_stack, address))
 
-    def visit(address: Address):
-        if address in visited:
-            maybe_report_cycle(address)
+    def visit(root: Address) -> None:
+        # NB: This is a depth-first walk using an explicit stack of dependency iterators, rather
+        # than recursion, so that long dependency chains cannot exceed Python's recursion limit.
+        if root in visited:
+            maybe_report_cycle(root)
             return
-        path_stack.add(address)
-        visited.add(address)
-
-        for dep_address in dependency_mapping[address]:
-            visit(dep_address)
-
-        path_stack.remove(address)
+        path_stack.add(root)
+        visited.add(root)
+        stack = [(root, iter(dependency_mapping[root]))]
+        while stack:
+            address, dep_addresses = stack[-1]
+            dep_address = next(dep_addresses, None)
+            if dep_address is None:
+                stack.pop()
+                path_stack.remove(address)
+                continue
+            if dep_address in visited:
+                maybe_report_cycle(dep_address)
+                continue
+            path_stack.add(dep_address)
+            visited.add(dep_address)
+            stack.append((dep_address, iter(dependency_mapping[dep_address])))
 
     for root in roots:
         visit(root)
         if path_stack:
             raise AssertionError(
-                f"The stack of visited nodes should have been empty at the end of recursion, "
+                f"The stack of visited nodes should have been empty at the end of the walk, "
                 f"but it still contained: {path_stack}"
             )
 
@@ -281,6 +292,9 @@ async def transitive_dependency_mapping(request: _DependencyMappingRequest) -> _
     visited: OrderedSet[Target] = OrderedSet()
     queued = FrozenOrderedSet(roots_as_targets)
     dependency_mapping: Dict[Address, Tuple[Address, ...]] = {}
+    # A cycle requires at least one dependency edge that leads to an already discovered target. If
+    # every edge discovers a new target, the graph is a forest, and we can skip cycle detection.
+    may_contain_cycles = False
     while queued:
         direct_dependencies: Tuple[Collection[Target], ...]
         if request.expanded_targets:
@@ -313,15 +327,20 @@ async def transitive_dependency_mapping(request: _DependencyMappingRequest) -> _
             )
         )
 
-        queued = FrozenOrderedSet(itertools.chain.from_iterable(direct_dependencies)).difference(
-            visited
+        # NB: We filter against `visited` directly, rather than using `.difference(visited)`, which
+        # would copy all of `visited` into a temporary set on every round.
+        queued = FrozenOrderedSet(
+            dep for dep in itertools.chain.from_iterable(direct_dependencies) if dep not in visited
         )
+        if not may_contain_cycles and len(queued) != sum(len(deps) for deps in direct_dependencies):
+            may_contain_cycles = True
         visited.update(queued)
 
     # NB: We use `roots_as_targets` to get the root addresses, rather than `request.roots`. This
     # is because expanding from the `Addresses` -> `Targets` may have resulted in generated
     # subtargets being used, so we need to use `roots_as_targets` to have this expansion.
-    _detect_cycles(tuple(t.address for t in roots_as_targets), dependency_mapping)
+    if may_contain_cycles:
+        _detect_cycles(tuple(t.address for t in roots_as_targets), dependency_mapping)
     return _DependencyMapping(
         FrozenDict(dependency_mapping), FrozenOrderedSet(visited), roots_as_targets
     )
@@ -334,7 +353,9 @@ async def transitive_targets(request: TransitiveTargetsRequest) -> TransitiveTar
     dependency_mapping = await Get(_DependencyMapping, _DependencyMappingRequest(request, True))
 
     # Apply any transitive excludes (`!!` ignores).
-    transitive_excludes: FrozenOrderedSet[Target] = FrozenOrderedSet()
+    # NB: Transitive excludes are rare, so we only build a filtered copy of the visited targets
+    # when there are any.
+    dependencies = dependency_mapping.visited
     unevaluated_transitive_excludes = []
     for t in (*dependency_mapping.roots_as_targets, *dependency_mapping.visited):
         unparsed = t.get(Dependencies).unevaluated_transitive_excludes
@@ -348,11 +369,9 @@ async def transitive_targets(request: TransitiveTargetsRequest) -> TransitiveTar
         transitive_excludes = FrozenOrderedSet(
             itertools.chain.from_iterable(excludes for excludes in nested_transitive_excludes)
         )
+        dependencies = dependencies.difference(transitive_excludes)
 
-    return TransitiveTargets(
-        tuple(dependency_mapping.roots_as_targets),
-        FrozenOrderedSet(dependency_mapping.visited.difference(transitive_excludes)),
-    )
+    return TransitiveTargets(tuple(dependency_mapping.roots_as_targets), dependencies)
 
 
 # -----------------------------------------------------------------------------------------------
@@ -3,6 +3,7 @@
 
 import itertools
 import os.path
+import sys
 from dataclasses import dataclass
 from pathlib import PurePath
 from textwrap import dedent
@@ -38,6 +39,7 @@ from pants.engine.internals.graph import (
     OwnersRequest,
     TooManyTargetsException,
     TransitiveExcludesNotSupportedError,
+    _detect_cycles,
 )
 from pants.engine.internals.scheduler import ExecutionError
 from pants.engine.rules import Get, MultiGet, rule
@@ -536,6 +538,20 @@ def test_dep_nocycle_indirect(transitive_targets_rule_runner: RuleRunner) -> Non
     }
 
 
+def test_dep_cycle_detection_deep_chain() -> None:
+    # Cycle detection must not be limited by the depth of the dependency graph.
+    addresses = [Address("", target_name=f"t{i}") for i in range(sys.getrecursionlimit() * 2)]
+    dependency_mapping = {a: (dep,) for a, dep in zip(addresses, addresses[1:])}
+    dependency_mapping[addresses[-1]] = ()
+    _detect_cycles((addresses[0],), dependency_mapping)
+
+    dependency_mapping[addresses[-1]] = (addresses[0],)
+    with pytest.raises(CycleException) as e:
+        _detect_cycles((addresses[0],), dependency_mapping)
+    assert e.value.subject == addresses[0]
+    assert e.value.path == (*addresses, addresses[0])
+
+
 def test_resolve_generated_subtarget() -> None:
     rule_runner = RuleRunner(target_types=[MockTarget])
     rule_runner.write_files({"demo/BUILD": "target(sources=['f1.txt', 'f2.txt'])"})
@@ -3,12 +3,14 @@
 
 from __future__ import annotations
 
+import ast
 import os.path
+import re
 import threading
-import tokenize
 from dataclasses import dataclass
 from difflib import get_close_matches
-from io import StringIO
+from functools import lru_cache
+from types import CodeType
 from typing import Any, Iterable
 
 from pants.base.exceptions import MappingError
@@ -35,11 +37,15 @@ class UnaddressableObjectError(MappingError):
 class ParseState(threading.local):
     def __init__(self):
         self._rel_path: str | None = None
+        self._rel_path_basename = ""
         self._target_adapters: list[TargetAdaptor] = []
 
     def reset(self, rel_path: str) -> None:
         self._rel_path = rel_path
-        self._target_adapters.clear()
+        self._rel_path_basename = os.path.basename(rel_path)
+        # N.B.: We start a fresh list rather than clearing the old one so that `parsed_targets`
+        # can hand its list over to the caller without copying it.
+        self._target_adapters = []
 
     def add(self, target_adapter: TargetAdaptor) -> None:
         self._target_adapters.append(target_adapter)
@@ -53,8 +59,15 @@ class ParseState(threading.local):
             )
         return self._rel_path
 
+    def rel_path_basename(self) -> str:
+        """The basename of `rel_path()`, computed once per BUILD file."""
+        if self._rel_path is None:
+            # Raises the appropriate error.
+            self.rel_path()
+        return self._rel_path_basename
+
     def parsed_targets(self) -> list[TargetAdaptor]:
-        return list(self._target_adapters)
+        return self._target_adapters
 
 
 class Parser:
@@ -68,6 +81,11 @@ class Parser:
         self._symbols, self._parse_state = self._generate_symbols(
             build_root, target_type_aliases, object_aliases
         )
+        # The exec globals and the prelude `__globals__` dicts for the most recently seen prelude
+        # symbols. See `_global_symbols`.
+        self._cached_global_symbols: tuple[
+            BuildFilePreludeSymbols, dict[str, Any], tuple[dict[str, Any], ...]
+        ] | None = None
 
     @staticmethod
     def _generate_symbols(
@@ -81,6 +99,8 @@ class Parser:
         parse_state = ParseState()
 
         class Registrar:
+            __slots__ = ("_type_alias",)
+
             def __init__(self, type_alias: str) -> None:
                 self._type_alias = type_alias
 
@@ -88,7 +108,7 @@ class Parser:
                 # Target names default to the name of the directory their BUILD file is in
                 # (as long as it's not the root directory).
                 if "name" not in kwargs:
-                    dirname = os.path.basename(parse_state.rel_path())
+                    dirname = parse_state.rel_path_basename()
                     if not dirname:
                         raise UnaddressableObjectError(
                             "Targets in root-level BUILD files must be named explicitly."
@@ -104,15 +124,28 @@ class Parser:
         parse_context = ParseContext(
             build_root=build_root, type_aliases=symbols, rel_path_oracle=parse_state
         )
-        for alias, object_factory in object_aliases.context_aware_object_factories.items():
-            symbols[alias] = object_factory(parse_context)
+        symbols.update(
+            (alias, object_factory(parse_context))
+            for alias, object_factory in object_aliases.context_aware_object_factories.items()
+        )
 
         return symbols, parse_state
 
-    def parse(
-        self, filepath: str, build_file_content: str, extra_symbols: BuildFilePreludeSymbols
-    ) -> list[TargetAdaptor]:
-        self._parse_state.reset(rel_path=os.path.dirname(filepath))
+    def _global_symbols(self, extra_symbols: BuildFilePreludeSymbols) -> dict[str, Any]:
+        """Returns our symbols merged with the given Build File Prelude symbols.
+
+        The prelude symbols are the same for every BUILD file in a run, so the merged dict is cached
+        for the most recently seen `extra_symbols`.
+        """
+        cached = self._cached_global_symbols
+        if cached is not None and cached[0] is extra_symbols:
+            _, global_symbols, prelude_globals = cached
+            # N.B.: The prelude functions' `__globals__` are shared by every Parser that sees these
+            # prelude symbols, and another Parser may have patched its own symbols in since we last
+            # did. So we always re-apply ours.
+            for globals_dict in prelude_globals:
+                globals_dict.update(self._symbols)
+            return global_symbols
 
         # We update the known symbols with Build File Preludes. This is subtle code; functions have
         # their own globals set on __globals__ which they derive from the environment where they
@@ -122,14 +155,35 @@ class Parser:
         # prelude files are present, they probably cannot see each others' symbols. We may choose
         # to change this at some point.
 
-        global_symbols = dict(self._symbols)
+        global_symbols = self._symbols.copy()
+        prelude_globals: dict[int, dict[str, Any]] = {}
         for k, v in extra_symbols.symbols.items():
             if hasattr(v, "__globals__"):
                 v.__globals__.update(global_symbols)
+                prelude_globals.setdefault(id(v.__globals__), v.__globals__)
             global_symbols[k] = v
 
+        self._cached_global_symbols = (
+            extra_symbols,
+            global_symbols,
+            tuple(prelude_globals.values()),
+        )
+        return global_symbols
+
+    def parse(
+        self, filepath: str, build_file_content: str, extra_symbols: BuildFilePreludeSymbols
+    ) -> list[TargetAdaptor]:
+        self._parse_state.reset(rel_path=os.path.dirname(filepath))
+
+        # Many BUILD files are empty or only contain comments, and cannot define any targets.
+        if _is_blank_or_comments(build_file_content):
+            return []
+
+        # NB: BUILD files may assign to globals, so each one executes against its own copy.
+        global_symbols = self._global_symbols(extra_symbols).copy()
+
         try:
-            exec(build_file_content, global_symbols)
+            exec(_compile_build_file(filepath, build_file_content), global_symbols)
         except NameError as e:
             valid_symbols = sorted(s for s in global_symbols.keys() if s != "__builtins__")
             original = e.args[0].capitalize()
@@ -152,26 +206,55 @@ class Parser:
                 f"{original}.\n\n{help_str}\n\nAll registered symbols: {valid_symbols}"
             )
 
-        error_on_imports(build_file_content, filepath)
-
         return self._parse_state.parsed_targets()
 
 
+# Matches the first line which has something other than whitespace or a comment.
+_CODE_LINE_RE = re.compile(r"^[ \t\f]*[^\s#]", re.MULTILINE)
+
+
+def _is_blank_or_comments(build_file_content: str) -> bool:
+    return _CODE_LINE_RE.search(build_file_content) is None
+
+
+# NB: The same BUILD files are parsed repeatedly over the life of pantsd, e.g. whenever any BUILD
+# file in their directory changes, so we avoid recompiling unchanged content.
+@lru_cache(maxsize=4096)
+def _compile_build_file(filepath: str, build_file_content: str) -> CodeType:
+    """Compile a BUILD file, first checking that it does not use any imports."""
+    if not _IMPORT_WORD_RE.search(build_file_content):
+        return compile(build_file_content, filepath, "exec")
+    # We need the AST to check for imports, so we compile from it rather than parsing the source a
+    # second time.
+    tree = ast.parse(build_file_content, filename=filepath)
+    _error_on_import_nodes(tree, filepath)
+    return compile(tree, filepath, "exec")
+
+
+# Matches `import` as a whole word. This has false positives (e.g. comments and strings), but no
+# false negatives, so it can be used to skip parsing files that cannot contain an import.
+_IMPORT_WORD_RE = re.compile(r"\bimport\b")
+
+
 def error_on_imports(build_file_content: str, filepath: str) -> None:
     # This is poor sandboxing; there are many ways to get around this. But it's sufficient to tell
     # users who aren't malicious that they're doing something wrong, and it has a low performance
     # overhead.
-    if "import" not in build_file_content:
+    if not _IMPORT_WORD_RE.search(build_file_content):
         return
-    io_wrapped_python = StringIO(build_file_content)
-    for token in tokenize.generate_tokens(io_wrapped_python.readline):
-        token_str = token[1]
-        lineno, _ = token[2]
-        if token_str != "import":
-            continue
-        raise ParseError(
-            f"Import used in {filepath} at line {lineno}. Import statements are banned in "
-            "BUILD files because they can easily break Pants caching and lead to stale results. "
-            f"\n\nInstead, consider writing a macro ({doc_url('macros')}) or "
-            f"writing a plugin ({doc_url('plugins-overview')}."
-        )
+    # NB: `ast.parse` is implemented in C, and is much faster than the pure-Python `tokenize`.
+    _error_on_import_nodes(ast.parse(build_file_content, filename=filepath), filepath)
+
+
+def _error_on_import_nodes(tree: ast.AST, filepath: str) -> None:
+    import_linenos = [
+        node.lineno for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+    if not import_linenos:
+        return
+    raise ParseError(
+        f"Import used in {filepath} at line {min(import_linenos)}. Import statements are banned in "
+        "BUILD files because they can easily break Pants caching and lead to stale results. "
+        f"\n\nInstead, consider writing a macro ({doc_url('macros')}) or "
+        f"writing a plugin ({doc_url('plugins-overview')}."
+    )
@@ -6,7 +6,12 @@ from __future__ import annotations
 import pytest
 
 from pants.build_graph.build_file_aliases import BuildFileAliases
-from pants.engine.internals.parser import BuildFilePreludeSymbols, ParseError, Parser
+from pants.engine.internals.parser import (
+    BuildFilePreludeSymbols,
+    ParseError,
+    Parser,
+    UnaddressableObjectError,
+)
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 
@@ -19,6 +24,76 @@ def test_imports_banned() -> None:
         )
     assert "Import used in dir/BUILD at line 4" in str(exc.value)
 
+    with pytest.raises(ParseError) as exc:
+        parser.parse(
+            "dir/BUILD",
+            "def f():\n    from os import path\n",
+            BuildFilePreludeSymbols(FrozenDict()),
+        )
+    assert "Import used in dir/BUILD at line 2" in str(exc.value)
+
+    # Identifiers, strings and comments which merely contain `import` are fine.
+    parser.parse(
+        "dir/BUILD",
+        "important = 'reimport'\n# import os\nx = 'import'\n",
+        BuildFilePreludeSymbols(FrozenDict()),
+    )
+
+
+def test_reparse_unchanged_content() -> None:
+    parser = Parser(build_root="", target_type_aliases=["tgt"], object_aliases=BuildFileAliases())
+    prelude_symbols = BuildFilePreludeSymbols(FrozenDict())
+    build_file_content = "tgt(name='t1')\ntgt(name='t2')\n"
+    first = parser.parse("dir/BUILD", build_file_content, prelude_symbols)
+    second = parser.parse("dir/BUILD", build_file_content, prelude_symbols)
+    assert [t.name for t in first] == ["t1", "t2"]
+    assert first == second
+
+
+def test_default_target_name() -> None:
+    parser = Parser(build_root="", target_type_aliases=["tgt"], object_aliases=BuildFileAliases())
+    prelude_symbols = BuildFilePreludeSymbols(FrozenDict())
+    (tgt,) = parser.parse("src/project/BUILD", "tgt()\n", prelude_symbols)
+    assert tgt.name == "project"
+    with pytest.raises(UnaddressableObjectError) as exc:
+        parser.parse("BUILD", "tgt()\n", prelude_symbols)
+    assert "Targets in root-level BUILD files must be named explicitly" in str(exc.value)
+
+
+def test_empty_build_file() -> None:
+    parser = Parser(build_root="", target_type_aliases=["tgt"], object_aliases=BuildFileAliases())
+    prelude_symbols = BuildFilePreludeSymbols(FrozenDict())
+    assert parser.parse("dir/BUILD", "", prelude_symbols) == []
+    assert parser.parse("dir/BUILD", "# A comment.\n\n  # Another.\n", prelude_symbols) == []
+
+
+def test_build_file_globals_are_isolated() -> None:
+    parser = Parser(build_root="", target_type_aliases=["tgt"], object_aliases=BuildFileAliases())
+    prelude_symbols = BuildFilePreludeSymbols(FrozenDict())
+    parser.parse("a/BUILD", "shared_name = 'from_a'\ntgt(name=shared_name)\n", prelude_symbols)
+    with pytest.raises(ParseError) as exc:
+        parser.parse("b/BUILD", "tgt(name=shared_name)\n", prelude_symbols)
+    assert "Name 'shared_name' is not defined" in str(exc.value)
+
+
+def test_prelude_shared_between_parsers() -> None:
+    prelude_globals: dict = {}
+    exec("def macro(**kwargs):\n    return tgt(**kwargs)\n", prelude_globals)
+    prelude_symbols = BuildFilePreludeSymbols(FrozenDict(macro=prelude_globals["macro"]))
+    parser_a, parser_b = (
+        Parser(build_root="", target_type_aliases=["tgt"], object_aliases=BuildFileAliases())
+        for _ in range(2)
+    )
+
+    def parsed_names(parser: Parser, build_file_content: str) -> list[str]:
+        return [t.name for t in parser.parse("x/BUILD", build_file_content, prelude_symbols)]
+
+    # Each Parser's targets must land in its own ParseState, even though both Parsers patch the
+    # same prelude function's `__globals__`.
+    assert parsed_names(parser_a, "macro(name='one')") == ["one"]
+    assert parsed_names(parser_b, "macro(name='two')") == ["two"]
+    assert parsed_names(parser_a, "macro(name='three')") == ["three"]
+
 
 def test_unrecogonized_symbol() -> None:
     def perform_test(extra_targets: list[str], dym: str) -> None:
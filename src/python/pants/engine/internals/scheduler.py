@@ -463,30 +463,33 @@ class SchedulerSession:
         except native_engine.PollTimeout:
             raise ExecutionTimeoutError("Timed out")
 
-        states = [
-            Throw(
-                raw_root.result(),
-                python_traceback=raw_root.python_traceback(),
-                engine_traceback=raw_root.engine_traceback(),
-            )
-            if raw_root.is_throw()
-            else Return(raw_root.result())
-            for raw_root in raw_roots
-        ]
-
-        roots = list(zip(execution_request.roots, states))
+        # NB: We partition on `is_throw()` while constructing the states, rather than re-checking
+        # the type of each state afterward.
+        returns: list[tuple[Any, Return]] = []
+        throws: list[tuple[Any, Throw]] = []
+        for root, raw_root in zip(execution_request.roots, raw_roots):
+            if raw_root.is_throw():
+                throw = Throw(
+                    raw_root.result(),
+                    python_traceback=raw_root.python_traceback(),
+                    engine_traceback=raw_root.engine_traceback(),
+                )
+                throws.append((root, throw))
+            else:
+                returns.append((root, Return(raw_root.result())))
 
         self._maybe_visualize()
-        logger.debug(
-            "computed %s nodes in %f seconds. there are %s total nodes.",
-            len(roots),
-            time.time() - start_time,
-            self._scheduler.graph_len(),
-        )
+        # NB: Counting the nodes in the graph requires a call into the engine, so we only do so if
+        # the message will actually be logged.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "computed %s nodes in %f seconds. there are %s total nodes.",
+                len(raw_roots),
+                time.time() - start_time,
+                self._scheduler.graph_len(),
+            )
 
-        returns = tuple((root, state) for root, state in roots if isinstance(state, Return))
-        throws = tuple((root, state) for root, state in roots if isinstance(state, Throw))
-        return returns, throws
+        return tuple(returns), tuple(throws)
 
     def _raise_on_error(self, throws: list[Throw]) -> NoReturn:
         exception_noun = pluralize(len(throws), "Exception")
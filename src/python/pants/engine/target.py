@@ -284,6 +284,7 @@ class Target:
     address: Address
     plugin_fields: Tuple[Type[Field], ...]
     field_values: FrozenDict[Type[Field], Field]
+    _hash: int
 
     @final
     def __init__(
@@ -332,6 +333,9 @@ class Target:
                 key=lambda field_type_to_val_pair: field_type_to_val_pair[0].alias,
             )
         )
+        # NB: Targets are immutable and are hashed frequently (e.g. when collected into sets), so we
+        # compute the hash once.
+        self._hash = hash((self.__class__, self.address, self.field_values))
 
         self.validate()
 
@@ -367,11 +371,15 @@ class Target:
         return f"{self.alias}({address}{fields})"
 
     def __hash__(self) -> int:
-        return hash((self.__class__, self.address, self.field_values))
+        return self._hash
 
     def __eq__(self, other: Union[Target, Any]) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Target):
             return NotImplemented
+        if self._hash != other._hash:
+            return False
         return (self.__class__, self.address, self.field_values) == (
             other.__class__,
             other.address,
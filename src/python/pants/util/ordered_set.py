@@ -168,8 +168,9 @@ class OrderedSet(_AbstractOrderedSet[T], MutableSet[T]):
 
     def update(self, iterable: Iterable[T]) -> None:
         """Update the set with the given iterable sequence."""
-        for item in iterable:
-            self.add(item)
+        # NB: A single bulk `dict.update` is considerably faster than calling `self.add()` per item,
+        # and likewise keeps the original position of any items that are already present.
+        self._items.update(dict.fromkeys(iterable))
 
     def discard(self, key: T) -> None:
         """Remove an element. Do not raise an exception if absent.